@@ -15,6 +15,7 @@ from phone_parser.phone import (
     Phone,
     is_valid,
     parse,
+    parse_many,
     set_default_area_code,
     set_default_country_code,
 )
@@ -26,6 +27,7 @@ __all__ = [
     "Phone",
     "is_valid",
     "parse",
+    "parse_many",
     "set_default_area_code",
     "set_default_country_code",
 ]
@@ -140,7 +140,7 @@ COUNTRIES_YAML = r"""
   name: South Africa
   international_dialing_prefix: "0"
   area_code: "800|86[01]|[1-9]\\d"
-  max_num_length: 11
+  max_num_length: "11"
 "508":
   country_code: "508"
   national_dialing_prefix: "0"
@@ -1488,11 +1488,14 @@ class Country:
     international_dialing_prefix: str = "0"
     char_2_code: str | None = None
 
-    # Compiled regex cache
-    _country_code_regex: Pattern[str] | None = field(
-        default=None, init=False, repr=False
-    )
-    _area_code_regex: Pattern[str] | None = field(default=None, init=False, repr=False)
+    # Compiled regex cache, filled lazily (set in __post_init__ for mypyc)
+    _country_code_regex: Pattern[str] | None = field(init=False, repr=False)
+    _area_code_regex: Pattern[str] | None = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Start with empty compiled regex caches."""
+        self._country_code_regex = None
+        self._area_code_regex = None
 
     def country_code_regexp(self) -> Pattern[str]:
         """Get compiled regex for matching country code prefix.
@@ -1559,6 +1562,7 @@ class CountryRegistry:
     """Global registry for country metadata with lookup utilities."""
 
     _countries: ClassVar[dict[str, Country]] = {}
+    _code_lengths: ClassVar[tuple[int, ...]] = ()
     _initialized: ClassVar[bool] = False
 
     @classmethod
@@ -1579,6 +1583,8 @@ class CountryRegistry:
                 international_dialing_prefix=data.get("international_dialing_prefix", "0"),  # type: ignore[arg-type]
                 char_2_code=data.get("char_2_code"),
             )
+        # Distinct dialing code lengths, longest first, for prefix lookups
+        cls._code_lengths = tuple(sorted({len(code) for code in cls._countries}, reverse=True))
         cls._initialized = True
 
     @classmethod
@@ -1646,10 +1652,12 @@ class CountryRegistry:
         """
         cls._initialize()
 
-        # Try to match country code prefix
-        for code, country in cls._countries.items():
-            if re.match(rf"^\+{re.escape(code)}", number):
-                return country
+        # Try to match country code prefix, longest code first
+        if number.startswith("+"):
+            for length in cls._code_lengths:
+                country = cls._countries.get(number[1 : length + 1])
+                if country is not None:
+                    return country
 
         # Fall back to default
         if default_code:
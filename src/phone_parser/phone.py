@@ -2,21 +2,29 @@
 
 from __future__ import annotations
 
+import functools
+import operator
 import re
-import threading
-from dataclasses import dataclass
-from typing import TYPE_CHECKING
+import sys
+from typing import TYPE_CHECKING, NamedTuple, TypeAlias
 
 from phone_parser.country import CountryRegistry
 
 if TYPE_CHECKING:
-    from re import Pattern
+    from collections.abc import Callable, Iterable
+
+    # (literal, field) pairs followed by the trailing literal
+    _FormatPlan: TypeAlias = tuple[tuple[tuple[str, Callable[["Phone"], str]], ...], str]
 
 # Common regex patterns for parsing
-COMMON_EXTENSIONS = r"(ext|ex|x|xt|#|:)+[^0-9]*([-0-9]{1,})*#?$"
+COMMON_EXTENSIONS = r"(ext|ex|x|xt|#|:)+[^0-9]*[-0-9]*#?$"
 COMMON_EXTRAS = r"(\(0\)|[^0-9+]|^\+?00?)"
 FORMAT_TOKENS = r"(%[caAnflx])"
 
+# Compiled once at import; these run on every parse/format call
+_EXT_RE = re.compile(COMMON_EXTENSIONS)
+_NON_DIGIT_RE = re.compile(r"[^0-9+]")
+
 # Normalization replacements
 EXTRA_REPLACEMENTS = {
     "(0)": "+",
@@ -25,6 +33,12 @@ EXTRA_REPLACEMENTS = {
     "+0": "+",
 }
 
+# Leading prefixes matched by the anchored part of COMMON_EXTRAS, longest first
+_LEADING_PREFIXES = ("+00", "00", "+0", "0")
+
+# Every ASCII byte except digits and "+", for bytes.translate deletion
+_NON_DIGIT_BYTES = bytes(c for c in range(128) if chr(c) not in "0123456789+")
+
 # Named format patterns
 NAMED_FORMATS = {
     "default": "+%c%a%n",
@@ -33,8 +47,24 @@ NAMED_FORMATS = {
     "us": "(%a) %f-%l",
 }
 
-# Thread-safe global defaults
-_defaults_lock = threading.Lock()
+# One shared "+{code}" string per known country, reused by every parse
+_COUNTRY_CODE_PREFIXES = {
+    country.country_code: sys.intern(f"+{country.country_code}")
+    for country in CountryRegistry.get_all().values()
+}
+
+# Value for each FORMAT_TOKENS code character
+_FORMAT_FIELDS: dict[str, Callable[[Phone], str]] = {
+    "c": operator.attrgetter("country_code"),
+    "a": operator.attrgetter("area_code"),
+    "A": operator.methodcaller("area_code_long"),
+    "n": operator.attrgetter("number"),
+    "f": operator.methodcaller("number1"),
+    "l": operator.methodcaller("number2"),
+    "x": operator.attrgetter("extension"),
+}
+
+# Global defaults; rebinding a module global is atomic, so no lock is needed
 _default_country_code: str | None = None
 _default_area_code: str | None = None
 
@@ -56,8 +86,7 @@ def set_default_country_code(code: str) -> str:
         '1'
     """
     global _default_country_code  # noqa: PLW0603
-    with _defaults_lock:
-        _default_country_code = code
+    _default_country_code = code
     return code
 
 
@@ -78,13 +107,11 @@ def set_default_area_code(code: str) -> str:
         '212'
     """
     global _default_area_code  # noqa: PLW0603
-    with _defaults_lock:
-        _default_area_code = code
+    _default_area_code = code
     return code
 
 
-@dataclass
-class Phone:
+class Phone(NamedTuple):
     """Represents a parsed phone number with all components.
 
     Attributes:
@@ -107,7 +134,8 @@ class Phone:
         Returns:
             Phone number in "+{country}{area}{number}" format.
         """
-        return self.format("default")
+        # Inlined "default" format, the most common rendering by far
+        return _remove_useless_plus(f"+{self.country_code}{self.area_code}{self.number}")
 
     def number1(self) -> str:
         """Get first N digits of number (for formatting).
@@ -166,9 +194,11 @@ class Phone:
             >>> phone.format("europe")
             '+385 (0) 91 512 5486'
         """
-        # Use named format if it exists
-        pattern = NAMED_FORMATS.get(fmt, fmt)
-        return self._format_number(pattern)
+        # Named formats are precompiled at import
+        plan = _FORMAT_PLANS.get(fmt)
+        if plan is not None:
+            return self._render(plan)
+        return self._format_number(NAMED_FORMATS.get(fmt, fmt))
 
     def _format_number(self, pattern: str) -> str:
         """Apply token replacements to format pattern.
@@ -179,22 +209,19 @@ class Phone:
         Returns:
             Formatted string with tokens replaced.
         """
-        replacements = {
-            "%c": self.country_code,
-            "%a": self.area_code,
-            "%A": self.area_code_long(),
-            "%n": self.number,
-            "%f": self.number1(),
-            "%l": self.number2(),
-            "%x": self.extension,
-        }
-
-        # Replace each token
-        regex: Pattern[str] = re.compile(FORMAT_TOKENS)
-        result = pattern
-        for match in regex.findall(pattern):
-            replacement = replacements.get(match, "")
-            result = result.replace(match, replacement, 1)
+        return self._render(_compile_format(pattern))
+
+    def _render(self, plan: _FormatPlan) -> str:
+        """Execute a compiled format plan.
+
+        Args:
+            plan: Plan returned by _compile_format.
+
+        Returns:
+            Formatted string with tokens replaced.
+        """
+        segments, tail = plan
+        result = "".join([literal + field(self) for literal, field in segments]) + tail
 
         # Clean up double plus signs
         return _remove_useless_plus(result)
@@ -226,26 +253,92 @@ def parse(phone_string: str) -> Phone | None:
     if not phone_string.strip():
         return None
 
-    # Extract extension first
-    clean_number, extension = _extract_extension(phone_string)
+    default_country_code = _default_country_code
+    default_area_code = _default_area_code
+
+    return _parse_impl(phone_string, default_country_code, default_area_code)
+
+
+def parse_many(phone_strings: Iterable[str]) -> list[Phone | None]:
+    """Parse a batch of phone number strings.
+
+    Defaults are read once for the whole batch, and repeated strings are
+    served from the parse cache. Unlike parse(), invalid entries do not
+    raise; they yield None just like empty ones.
+
+    Args:
+        phone_strings: Phone number strings in any common format.
+
+    Returns:
+        List with a Phone object (or None) per input string, in order.
+
+    Example:
+        >>> phones = parse_many(["+385915125486", "", "+12125551234"])
+        >>> [phone.country_code if phone else None for phone in phones]
+        ['+385', None, '+1']
+    """
+    default_country_code = _default_country_code
+    default_area_code = _default_area_code
+
+    results: list[Phone | None] = []
+    for phone_string in phone_strings:
+        if not phone_string.strip():
+            results.append(None)
+            continue
+
+        try:
+            results.append(_parse_impl(phone_string, default_country_code, default_area_code))
+        except ValueError:
+            results.append(None)
+
+    return results
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_impl(
+    phone_string: str, default_country_code: str | None, default_area_code: str | None
+) -> Phone:
+    """Parse phone number string into a Phone object.
+
+    Memoized on the input string and the defaults in effect, so repeated
+    lookups of the same number skip the regex work entirely. Phone is
+    immutable, so cached objects are safe to share between callers.
+
+    Args:
+        phone_string: Non-empty phone number string.
+        default_country_code: Default country code at call time.
+        default_area_code: Default area code at call time.
+
+    Returns:
+        Parsed Phone object.
+
+    Raises:
+        ValueError: If phone number is invalid or required components missing.
+    """
+    if _is_canonical(phone_string):
+        # Nothing for the extension and normalization passes to change
+        clean_number, extension = phone_string, ""
+    else:
+        # Extract extension first
+        clean_number, extension = _extract_extension(phone_string)
 
-    # Normalize to standard format
-    clean_number = _normalize(clean_number)
+        # Normalize to standard format
+        clean_number = _normalize(clean_number)
 
     # Split into components
-    number, area_code, country_code = _split_to_parts(clean_number)
+    number, area_code, country_code = _split_to_parts(clean_number, default_country_code)
 
     # Apply defaults if needed
     if not country_code:
-        if _default_country_code:
-            country_code = f"+{_default_country_code}"
+        if default_country_code:
+            country_code = _country_code_prefix(default_country_code)
         else:
             msg = "Must specify country code or set default"
             raise ValueError(msg)
 
     if not area_code:
-        if _default_area_code:
-            area_code = _default_area_code
+        if default_area_code:
+            area_code = default_area_code
         else:
             msg = "Must specify area code or set default"
             raise ValueError(msg)
@@ -283,6 +376,20 @@ def is_valid(phone_string: str) -> bool:
         return False
 
 
+def _is_canonical(phone_string: str) -> bool:
+    """Check if a phone number string is already in normalized form.
+
+    Args:
+        phone_string: Raw phone number string.
+
+    Returns:
+        True for ASCII digits, optionally after a single "+", not
+        starting with a zero.
+    """
+    digits = phone_string[1:] if phone_string.startswith("+") else phone_string
+    return digits.isascii() and digits.isdigit() and not digits.startswith("0")
+
+
 def _extract_extension(phone_string: str) -> tuple[str, str]:
     """Extract extension from phone number string.
 
@@ -292,13 +399,15 @@ def _extract_extension(phone_string: str) -> tuple[str, str]:
     Returns:
         Tuple of (number_without_extension, extension).
     """
-    regex: Pattern[str] = re.compile(COMMON_EXTENSIONS)
-    match = regex.search(phone_string)
+    # Every extension marker contains one of these; skip the regex otherwise
+    if "x" not in phone_string and "#" not in phone_string and ":" not in phone_string:
+        return phone_string, ""
+
+    match = _EXT_RE.search(phone_string)
 
     if match:
-        extension = match.group()
-        clean_number = regex.sub("", phone_string)
-        return clean_number, extension
+        # The pattern is anchored at the end, so the match is the whole tail
+        return phone_string[: match.start()], match.group()
 
     return phone_string, ""
 
@@ -306,28 +415,37 @@ def _extract_extension(phone_string: str) -> tuple[str, str]:
 def _normalize(phone_string: str) -> str:
     """Normalize phone number by replacing common patterns.
 
+    Equivalent to substituting every COMMON_EXTRAS match with its
+    EXTRA_REPLACEMENTS entry, using plain string operations.
+
     Args:
         phone_string: Raw phone number string.
 
     Returns:
         Normalized string with standardized prefixes.
     """
-    result = phone_string
-    regex: Pattern[str] = re.compile(COMMON_EXTRAS)
-
-    # Replace common extras
-    for match in regex.findall(result):
-        replacement = EXTRA_REPLACEMENTS.get(match, "")
-        result = regex.sub(replacement, result, count=1)
+    prefix = ""
+    for leading in _LEADING_PREFIXES:
+        if phone_string.startswith(leading):
+            prefix = EXTRA_REPLACEMENTS.get(leading, "")
+            phone_string = phone_string[len(leading) :]
+            break
+
+    result = phone_string.replace("(0)", "+")
+    if result.isascii():
+        result = result.encode("ascii").translate(None, _NON_DIGIT_BYTES).decode("ascii")
+    else:
+        result = _NON_DIGIT_RE.sub("", result)
 
-    return result
+    return prefix + result
 
 
-def _split_to_parts(phone_string: str) -> tuple[str, str, str]:
+def _split_to_parts(phone_string: str, default_country_code: str | None) -> tuple[str, str, str]:
     """Split normalized phone number into components.
 
     Args:
         phone_string: Normalized phone number string.
+        default_country_code: Fallback country code if detection fails.
 
     Returns:
         Tuple of (number, area_code, country_code).
@@ -336,45 +454,51 @@ def _split_to_parts(phone_string: str) -> tuple[str, str, str]:
         ValueError: If country code cannot be detected.
     """
     # Detect country from prefix
-    country = CountryRegistry.detect_from_number(phone_string, _default_country_code)
+    country = CountryRegistry.detect_from_number(phone_string, default_country_code)
 
     if country is None:
         msg = "Must specify country code"
         raise ValueError(msg)
 
     # Check if phone_string has country code prefix
-    has_country_prefix = phone_string.startswith(f"+{country.country_code}")
-
-    # Remove country code prefix and replace with leading zero
-    country_regex = country.country_code_regexp()
-    working_string = country_regex.sub("0", phone_string)
-
-    # Detect format
-    format_type = country.detect_format(working_string)
-    if not format_type:
-        msg = f"Invalid phone number format for country {country.name}"
-        raise ValueError(msg)
+    country_code = _country_code_prefix(country.country_code)
+    has_country_prefix = phone_string.startswith(country_code)
 
     area_code = ""
     number = ""
 
     # Only extract area code from number if country prefix was present
     if has_country_prefix:
-        # Extract area code (skip leading zero)
-        area_regex = country.area_code_regexp()
-        # Remove leading zero before matching area code
-        working_no_zero = working_string.lstrip("0")
-        area_match = area_regex.match(working_no_zero)
-        area_code = area_match.group() if area_match else ""
-
-        # Extract number (remove area code from working string without leading zeros)
-        number = working_no_zero[len(area_code) :] if area_code else working_no_zero
+        # Skip the country code and any trunk zeros without slicing
+        start = len(country_code)
+        end = len(phone_string)
+        while start < end and phone_string[start] == "0":
+            start += 1
+
+        # Extract area code and number in place from the offset
+        area_match = country.area_code_regexp().match(phone_string, start)
+        if area_match:
+            area_code = area_match.group()
+            start = area_match.end()
+        number = phone_string[start:]
     else:
         # No country prefix - treat entire string as the number
         # Area code will be filled from defaults in parse()
-        number = working_string.lstrip("0")
+        number = phone_string.lstrip("0")
 
-    return number, area_code, f"+{country.country_code}"
+    return number, area_code, country_code
+
+
+def _country_code_prefix(code: str) -> str:
+    """Get the "+"-prefixed form of a country code.
+
+    Args:
+        code: Country dialing code without "+".
+
+    Returns:
+        Shared "+{code}" string for known countries, a new one otherwise.
+    """
+    return _COUNTRY_CODE_PREFIXES.get(code) or f"+{code}"
 
 
 def _remove_useless_plus(formatted: str) -> str:
@@ -386,5 +510,39 @@ def _remove_useless_plus(formatted: str) -> str:
     Returns:
         Cleaned string with single plus prefix.
     """
-    regex: Pattern[str] = re.compile(r"^(\+ \+)|^(\+\+)")
-    return regex.sub("+", formatted)
+    if formatted.startswith("++"):
+        return "+" + formatted[2:]
+    if formatted.startswith("+ +"):
+        return "+" + formatted[3:]
+    return formatted
+
+
+def _compile_format(pattern: str) -> _FormatPlan:
+    """Split a format pattern into literal runs and token fields.
+
+    Args:
+        pattern: Format string with %tokens.
+
+    Returns:
+        Tuple of ((literal, field) pairs, trailing literal). Unknown
+        tokens are kept as literal text.
+    """
+    segments: list[tuple[str, Callable[[Phone], str]]] = []
+    start = 0
+    last = len(pattern) - 1  # a token needs a code character after "%"
+    index = pattern.find("%")
+
+    while 0 <= index < last:
+        field = _FORMAT_FIELDS.get(pattern[index + 1])
+        if field is None:
+            index = pattern.find("%", index + 1)
+            continue
+        segments.append((pattern[start:index], field))
+        start = index + 2
+        index = pattern.find("%", start)
+
+    return tuple(segments), pattern[start:]
+
+
+# Compiled plans for the named formats
+_FORMAT_PLANS = {name: _compile_format(pattern) for name, pattern in NAMED_FORMATS.items()}
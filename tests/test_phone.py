@@ -7,6 +7,7 @@ from phone_parser import (
     Phone,
     is_valid,
     parse,
+    parse_many,
     set_default_area_code,
     set_default_country_code,
 )
@@ -32,6 +33,15 @@ class TestPhoneParsing:
         assert phone.country_code == "+385"
         assert phone.area_code == "91"
 
+    def test_parse_shares_country_code_string(self) -> None:
+        """Test parsed numbers share one country code string per country."""
+        first = parse("+385915125486")
+        second = parse("+385 1 234 5678")
+
+        assert first is not None
+        assert second is not None
+        assert first.country_code is second.country_code
+
     def test_parse_us_number(self) -> None:
         """Test parsing US phone number."""
         phone = parse("+12125551234")
@@ -49,6 +59,13 @@ class TestPhoneParsing:
         assert phone.extension != ""
         assert "148" in phone.extension
 
+    def test_parse_long_digit_run_after_marker(self) -> None:
+        """Test a non-extension digit run after a marker parses promptly."""
+        phone = parse("+385915125486x" + "1" * 40 + "a")
+
+        assert phone is not None
+        assert phone.extension == ""
+
     def test_parse_relaxed_validation(self) -> None:
         """Test that parsing strips non-numeric characters."""
         phone = parse("blabla +385 91 512-5486 blabla")
@@ -77,6 +94,39 @@ class TestPhoneParsing:
         set_default_country_code("")
         set_default_area_code("")
 
+    def test_parse_repeated_respects_current_defaults(self) -> None:
+        """Test repeated parses of one string follow default changes."""
+        set_default_country_code("385")
+        set_default_area_code("47")
+        first = parse("451588")
+
+        set_default_area_code("1")
+        second = parse("451588")
+
+        assert first is not None
+        assert second is not None
+        assert first is not second
+        assert first.area_code == "47"
+        assert second.area_code == "1"
+
+        # Reset defaults
+        set_default_country_code("")
+        set_default_area_code("")
+
+    def test_parse_strips_separators_once(self) -> None:
+        """Test each separator is stripped without touching the trunk prefix."""
+        set_default_country_code("385")
+        set_default_area_code("47")
+
+        phone = parse(" 091 512 5486")
+
+        assert phone is not None
+        assert phone.number == "915125486"
+
+        # Reset defaults
+        set_default_country_code("")
+        set_default_area_code("")
+
     def test_parse_missing_country_code_raises(self) -> None:
         """Test that missing country code raises ValueError."""
         set_default_country_code("")  # Clear default
@@ -96,6 +146,32 @@ class TestPhoneParsing:
         set_default_country_code("")
 
 
+class TestBatchParsing:
+    """Test suite for batch phone number parsing."""
+
+    def test_parse_many_preserves_order(self) -> None:
+        """Test parse_many returns one result per input, in order."""
+        phones = parse_many(["+385915125486", "+12125551234", "+385915125486"])
+
+        assert [phone.country_code if phone else None for phone in phones] == [
+            "+385",
+            "+1",
+            "+385",
+        ]
+
+    def test_parse_many_invalid_entries_are_none(self) -> None:
+        """Test parse_many yields None for empty and invalid entries."""
+        set_default_country_code("")
+        set_default_area_code("")
+
+        phones = parse_many(["", "invalid", "+385915125486"])
+
+        assert phones[0] is None
+        assert phones[1] is None
+        assert phones[2] is not None
+        assert phones[2].number == "5125486"
+
+
 class TestPhoneValidation:
     """Test suite for phone number validation."""
 
@@ -144,6 +220,13 @@ class TestPhoneFormatting:
         formatted = phone.format("%A/%f-%l")
         assert formatted == "091/512-5486"
 
+    def test_format_repeated_and_unknown_tokens(self) -> None:
+        """Test repeated tokens are all replaced and unknown tokens kept."""
+        phone = Phone(number="5125486", area_code="91", country_code="+385")
+
+        formatted = phone.format("%a %a %z")
+        assert formatted == "91 91 %z"
+
     def test_format_with_extension(self) -> None:
         """Test formatting with extension."""
         phone = Phone(
@@ -154,11 +237,21 @@ class TestPhoneFormatting:
         assert "+385915125486" in formatted
         assert "x143" in formatted
 
+    def test_format_collapses_plus_with_bare_country_code(self) -> None:
+        """Test named formats work with or without a "+" in country_code."""
+        with_plus = Phone(number="5125486", area_code="91", country_code="+385")
+        bare = Phone(number="5125486", area_code="91", country_code="385")
+
+        assert with_plus.format("default") == "+385915125486"
+        assert bare.format("default") == "+385915125486"
+        assert with_plus.format("+ %c") == "+385"
+
     def test_str_representation(self) -> None:
         """Test __str__ uses default format."""
         phone = Phone(number="5125486", area_code="91", country_code="+385")
 
         assert str(phone) == "+385915125486"
+        assert str(phone) == phone.format("default")
 
     def test_number_splitting(self) -> None:
         """Test number1 and number2 methods."""
@@ -169,6 +262,22 @@ class TestPhoneFormatting:
         assert phone.number1() == "512"
         assert phone.number2() == "5486"
 
+    def test_phone_has_no_instance_dict(self) -> None:
+        """Test Phone uses slots instead of a per-instance __dict__."""
+        phone = Phone(number="5125486", area_code="91", country_code="+385")
+
+        assert not hasattr(phone, "__dict__")
+
+    def test_phone_is_immutable_and_hashable(self) -> None:
+        """Test Phone values are immutable and usable in sets."""
+        phone = Phone(number="5125486", area_code="91", country_code="+385")
+        same = Phone(number="5125486", area_code="91", country_code="+385")
+
+        with pytest.raises(AttributeError):
+            phone.number = "1234567"  # type: ignore[misc]
+        assert phone == same
+        assert len({phone, same}) == 1
+
     def test_area_code_long(self) -> None:
         """Test area_code_long adds leading zero."""
         phone = Phone(number="5125486", area_code="91", country_code="+385")
@@ -203,6 +312,22 @@ class TestCountryLookup:
         assert country_lower is not None
         assert country_upper.country_code == country_lower.country_code
 
+    def test_detect_from_number_by_prefix(self) -> None:
+        """Test detection resolves dialing codes of every length."""
+        for number, code in (("+12125551234", "1"), ("+4420", "44"), ("+385915125486", "385")):
+            country = CountryRegistry.detect_from_number(number)
+
+            assert country is not None
+            assert country.country_code == code
+
+    def test_detect_from_number_falls_back_to_default(self) -> None:
+        """Test detection uses the default code without a "+" prefix."""
+        country = CountryRegistry.detect_from_number("915125486", "385")
+
+        assert country is not None
+        assert country.country_code == "385"
+        assert CountryRegistry.detect_from_number("915125486") is None
+
     def test_find_nonexistent_country(self) -> None:
         """Test that nonexistent country returns None."""
         country = CountryRegistry.find_by_code("999")